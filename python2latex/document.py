@@ -71,7 +71,8 @@ class Document(TexEnvironment):
               compile_to_pdf=True,
               show_pdf=True,
               delete_files=list(),
-              build_from_dir='cwd'):
+              build_from_dir='cwd',
+              precompile_preamble=False):
         r"""
         Builds the document to a tex file and optionally compiles it into tex and show the output pdf in the default pdf reader of the system.
 
@@ -90,18 +91,27 @@ class Document(TexEnvironment):
                 With the 'cwd' option, pdflatex will be called from the current working directory, like this:
                     ~/some/path/to/cwd> pdflatex 'filepath/filename.tex'
                 This can be important if you include content in the TeX file, such as with the command \input{<path_to_some_file>}, where 'path_to_some_file' should be relative to the directory where pdflatex is called.
+            precompile_preamble (bool):
+                If True, the preamble is dumped once into a format file with the 'mylatexformat' package, and the following compilations reuse it as long as the preamble does not change. This saves the loading time of the packages (e.g. TikZ and pgfplots), which dominates the compilation time of small documents. The format is only compiled if 'compile_to_pdf' is True.
 
         Returns:
             The tex string of the file.
         """
-        tex = super().build()
-
-        tex = build(self.doc_class) + '\n' + self.build_preamble() + '\n' + tex
+        body = super().build()  # Building the body first collects the packages needed by the nested objects
+
+        if precompile_preamble:
+            # Only the class and the packages are dumped in the format. The other lines of the preamble, such as the configuration of the TikZ 'external' library which depends on the job name, are read at each compilation after the end of the dump.
+            dumped_header = '\n'.join([build(self.doc_class), self.build_packages()])
+            header = '\n'.join([dumped_header, r'\csname endofdump\endcsname'] + self._build_preamble_lines())
+        else:
+            header = '\n'.join([build(self.doc_class), self.build_preamble()])
+        tex = '\n'.join([header, body])
         if save_to_disk:
             self.file.save(tex)
 
             if compile_to_pdf:
-                self.file.compile_to_pdf(build_from_dir=build_from_dir)
+                fmt = self.file.precompile_preamble(dumped_header, build_from_dir) if precompile_preamble else None
+                self.file.compile_to_pdf(build_from_dir=build_from_dir, fmt=fmt)
 
                 if show_pdf:
                     open_file_with_default_program(self.filename, self.filepath)
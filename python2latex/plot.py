@@ -1,4 +1,6 @@
 import os
+import io
+import hashlib
 from datetime import datetime as dt
 import itertools
 import csv
@@ -21,7 +23,10 @@ class _AxisProperty:
 
 class _AxisTicksProperty(_AxisProperty):
     def __set__(self, obj, value):
-        value = '{' + ','.join(f"{v:.3f}" for v in value) + '}'
+        # Converting to Python floats at once avoids formatting numpy scalars one by one, which is much slower
+        ticks = tuple(np.fromiter(value, dtype=np.float64).tolist())
+        # A single format call with a format string specialized to the number of ticks is faster than formatting each tick
+        value = '{' + ','.join(['%.3f'] * len(ticks)) % ticks + '}'
         obj.kwoptions[self.param_name] = value
 
 
@@ -65,6 +70,7 @@ class Plot(FloatingEnvironmentMixin, super_class=FloatingFigure):
                  caption='',
                  caption_pos='bottom',
                  caption_space='',
+                 externalize=False,
                  **axis_kwoptions):
         """
         Args:
@@ -100,6 +106,8 @@ class Plot(FloatingEnvironmentMixin, super_class=FloatingFigure):
                 Label of the environment.
             caption, caption_pos, caption_space:
                 See _FloatingEnvironment for description.
+            externalize (bool):
+                If True, the plot is externalized with the TikZ 'external' library: it is compiled once into its own pdf, which is then included as is in the following compilations as long as the plot and its data do not change. The plots to compile are compiled in parallel. This can greatly speed up the compilation of documents with many plots. Requires to compile from the directory of the TeX file (build_from_dir='source'), unless the TeX file is saved in the current working directory. Otherwise, a ValueError is raised at compilation.
             axis_kwoptions (dict):
                 pgfplots keyword options for the axis. All underscore will be replaced by spaces when converted to LaTeX parameters.
         """
@@ -114,7 +122,15 @@ class Plot(FloatingEnvironmentMixin, super_class=FloatingFigure):
         self.add_package('pgfplots')
         self.add_package('pgfplotstable')
 
-        self.tikzpicture = self.new(TexEnvironment('tikzpicture'))
+        self.externalize = externalize
+        if externalize:
+            self.add_to_preamble(TexCommand('usetikzlibrary', 'external'))
+            # The name of the externalized file already changes with the content of the picture, so only its existence is checked instead of the md5 of the TeX, which contains the csv path.
+            # Exporting is disabled by default so that the other pictures of the document, whose names would be numbered automatically, are not externalized.
+            self.add_to_preamble(TexCommand('tikzexternalize', options=['mode=list and make', 'up to date check=simple', 'export=false'], options_pos='first'))
+            self.tikzpicture = self.new(_ExternalizedTikzPicture())
+        else:
+            self.tikzpicture = self.new(TexEnvironment('tikzpicture'))
 
         self.plot_name = plot_name or f"plot-{dt.now().strftime(r'%Y-%m-%d %Hh%Mm%Ss')}"
         self.plot_path = plot_path
@@ -152,28 +168,44 @@ class Plot(FloatingEnvironmentMixin, super_class=FloatingFigure):
         object.__setattr__(self, name, value)
 
     def save_to_csv(self):
-        os.makedirs(self.plot_path, exist_ok=True)
         plots = self.axis.plots
         matrix_plot = self.axis.matrix_plot
 
-        with open(self.plot_filepath, 'w', newline='') as file:
-            writer = csv.writer(file)
-
-            titles = [coor for p in plots for coor in (f'x{p.id_number}', f'y{p.id_number}')]
-            if matrix_plot:
-                titles += [
-                    f'x{matrix_plot.id_number}',
-                    f'y{matrix_plot.id_number}',
-                    f'z{matrix_plot.id_number}'
-                ]
+        titles = [coor for p in plots for coor in (f'x{p.id_number}', f'y{p.id_number}')]
+        if matrix_plot:
+            titles += [
+                f'x{matrix_plot.id_number}',
+                f'y{matrix_plot.id_number}',
+                f'z{matrix_plot.id_number}'
+            ]
+        data = [x_y for p in plots for x_y in (p.X, p.Y)]
+        if matrix_plot:
+            XX, YY = np.meshgrid(matrix_plot.X, matrix_plot.Y)
+            data += [XX.reshape(-1), YY.reshape(-1), matrix_plot.Z.T.reshape(-1)]
+
+        if all(array.dtype.kind in 'biuf' for array in data):
+            # Numbers never need quoting, so each row is formatted by a single call to a format string specialized to the number of columns, which is much faster than csv.writer.
+            row_format = ','.join(['%s'] * len(titles)) + '\r\n'
+            # Python scalars are also much faster to format than numpy scalars, but other floats than float64 would not print the same once converted
+            columns = [array.tolist() if array.dtype.kind in 'biu' or array.dtype == np.float64 else array for array in data]
+            rows = itertools.zip_longest(*columns, fillvalue='')
+            csv_content = ''.join([row_format % tuple(titles)] + [row_format % row for row in rows])
+        else:
+            csv_buffer = io.StringIO(newline='')
+            writer = csv.writer(csv_buffer)
             writer.writerow(titles)
-            data = [x_y for p in plots for x_y in (p.X, p.Y)]
-            if matrix_plot:
-                XX, YY = np.meshgrid(matrix_plot.X, matrix_plot.Y)
-                data += [XX.reshape(-1), YY.reshape(-1), matrix_plot.Z.T.reshape(-1)]
+            writer.writerows(itertools.zip_longest(*data, fillvalue=''))
+            csv_content = csv_buffer.getvalue()
 
-            for row in itertools.zip_longest(*data, fillvalue=''):
-                writer.writerow(row)
+        # Rewriting identical data would only cost a write and change the modification time of the file
+        if os.path.exists(self.plot_filepath):
+            with open(self.plot_filepath, 'r', newline='') as file:
+                if file.read() == csv_content:
+                    return
+
+        os.makedirs(self.plot_path, exist_ok=True)
+        with open(self.plot_filepath, 'w', newline='') as file:
+            file.write(csv_content)
 
     def add_plot(self, *args, **kwargs):
         return self.axis.add_plot(*args, **kwargs)
@@ -186,6 +218,38 @@ class Plot(FloatingEnvironmentMixin, super_class=FloatingFigure):
         return super().build()
 
 
+class _ExternalizedTikzPicture(TexEnvironment):
+    """
+    'tikzpicture' environment externalized with the TikZ 'external' library. The externalized file is named after a hash of the TeX of the picture, of the preamble lines it needs and of the data of its plots, so that an unchanged picture is never compiled twice. The csv path is left out of the hash since it does not change the picture.
+    """
+    def __init__(self):
+        super().__init__('tikzpicture')
+
+    def _externalized_filename(self, tex):
+        axes = [axis for axis in self.body if isinstance(axis, Axis)]
+        # The path of the csv changes with the default plot name, which is the time of creation of the plot, while its content is hashed below
+        for axis in axes:
+            if axis.plot_filepath:
+                tex = tex.replace(axis.plot_filepath, '')
+        digest = hashlib.blake2b(tex.encode('utf8'), digest_size=8)
+        # The picture only refers to the colors by name, they are defined in the preamble
+        digest.update(self.build_preamble().encode('utf8'))
+        for axis in axes:
+            plots = axis.plots + ([axis.matrix_plot] if axis.matrix_plot is not None else [])
+            for plot in plots:
+                for array in (plot.X, plot.Y, getattr(plot, 'Z', None)):
+                    if array is not None:
+                        digest.update(str(array.shape).encode('utf8'))
+                        digest.update(array.tobytes())
+        return f'plot-{digest.hexdigest()}'
+
+    def build(self):
+        tex = super().build()
+        return '\n'.join([TexCommand('tikzsetnextfilename', self._externalized_filename(tex)).build(),
+                          TexCommand('tikzset', 'external/export next=true').build(),
+                          tex])
+
+
 class Axis(TexEnvironment):
     """
     Implementation of an axis environment.
@@ -358,11 +422,13 @@ class Axis(TexEnvironment):
         every_plot_kwoptions = ', '.join('='.join([k, v]) for k, v in self.default_plot_kwoptions.items())
         if every_plot_kwoptions:
             every_plot_options += ', ' + every_plot_kwoptions
-        self.options += (
-            f"every axis plot/.append style={{{every_plot_options}}}",
-        )
 
-        return super().build()
+        # The style is only added for this build so that building again yields the same TeX
+        self.head.options = self.options + [f"every axis plot/.append style={{{every_plot_options}}}"]
+        try:
+            return super().build()
+        finally:
+            self.head.options = self.options
 
 
 class _Plot(TexCommand):
@@ -429,13 +495,18 @@ class LinePlot(_Plot):
     def build(self):
         assert self.plot_filepath is not None
         legend = ''
+        options = self.options
         if self.legend:
             legend = f"\n\\addlegendentry{{{self.legend}}};"
         elif self.forget_plot:
-            self.options += ('forget plot', )
+            self.options = options + ['forget plot']  # Only for this build, so that building again yields the same TeX
 
-        return super().build(
-        ) + f" table[x=x{self.id_number}, y=y{self.id_number}, col sep=comma]{{{self.plot_filepath}}}{self.label};" + legend
+        try:
+            command = super().build()
+        finally:
+            self.options = options
+
+        return command + f" table[x=x{self.id_number}, y=y{self.id_number}, col sep=comma]{{{self.plot_filepath}}}{self.label};" + legend
 
 
 class MatrixPlot(_Plot):
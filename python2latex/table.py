@@ -163,48 +163,59 @@ class Tabular(TexEnvironment):
         return repr(self.data)
 
     def _apply_commands(self, i, j, content):
-        command_list = self.commands[i, j]
+        return self._apply_command_list(self.commands[i, j], content)
+
+    def _apply_command_list(self, command_list, content):
         for command in command_list:
             content = build(command(content), self)
         return content
 
     def _format_number(self, i, j, content):
-        format_spec = self.formats_spec[i, j]
-
-        if not isinstance(content, (Real, Integral)):
+        return self._format_content(self.formats_spec[i, j], content)
+
+    def _format_content(self, format_spec, content):
+        # Exact type checks first since they are much cheaper than the isinstance checks on abstract classes
+        content_type = type(content)
+        if content_type is float:
+            is_integral = False
+        elif content_type is int:
+            is_integral = True
+        elif content_type is str or not isinstance(content, Real):
             return content
+        else:
+            is_integral = isinstance(content, Integral)
 
-        if format_spec is not None:
-            content = format(content, format_spec)
-        elif format_spec is None and isinstance(content, Integral):
-            content = format(content, self.int_format)
-        elif format_spec is None and isinstance(content, Real): # Fallback to default
-            content = format(content, self.float_format)
+        if format_spec is None: # Fallback to default
+            format_spec = self.int_format if is_integral else self.float_format
+        content = format(content, format_spec)
 
         if self.decimal_separator != '.':
             content = content.replace('.', self.decimal_separator)
 
         return content
 
-    def _apply_multicells(self, tex_array, tex_array_format):
+    def _multicells_by_start(self):
+        """
+        Returns a dict mapping the top left cell (i, j) of each multicell to the list of the shapes and alignment parameters of the multicells starting there.
+        """
+        multicells = {}
         for idx, v_align, h_align, v_shift in self.multicells:
-
             start_i, stop_i, _ = idx[0].indices(self.shape[0])
             start_j, stop_j, _ = idx[1].indices(self.shape[1])
-
-            tex_array_format[start_i, slice(start_j, stop_j - 1)] = ''
-            cell_shape = tex_array[idx].shape
-            content = tex_array[start_i, start_j]
-
-            if start_i == stop_i - 1: # Multicolumn only
-                content = multicolumn(cell_shape[1], h_align, content)
-            else: # Multirow needed
-                content = multirow(cell_shape[0], v_align, v_shift, content)
-
-            if start_j < stop_j - 1 and start_i < stop_i - 1: # Multirow and multicolumn needed
-                content = multicolumn(cell_shape[1], h_align, content)
-
-            tex_array[start_i, start_j] = content
+            cell_shape = (stop_i - start_i, stop_j - start_j)
+            multicells.setdefault((start_i, start_j), []).append((cell_shape, v_align, h_align, v_shift))
+        return multicells
+
+    @staticmethod
+    def _merge_cells(content, cell_shape, v_align, h_align, v_shift):
+        n_rows, n_cols = cell_shape
+        if n_rows == 1: # Multicolumn only
+            return multicolumn(n_cols, h_align, content)
+
+        content = multirow(n_rows, v_align, v_shift, content)
+        if n_cols > 1: # Multirow and multicolumn needed
+            content = multicolumn(n_cols, h_align, content)
+        return content
 
     def build(self):
         tex = [build(self.head) + '{' + ''.join(self.alignment) + '}']
@@ -212,21 +223,26 @@ class Tabular(TexEnvironment):
         if self.top_rule:
             tex.append(r'\toprule')
 
-        tex_array = np.full_like(self.data, '', dtype=object)
-
-        for i, row in enumerate(self.data):
-            for j, content in enumerate(row):
-                content = self._format_number(i, j, content)
-                content = build(content)
-                content = self._apply_commands(i, j, content)
-                tex_array[i, j] = content
-
-        tex_array_format = np.array([[' & ']*(self.shape[1] - 1) + [r'\\']]*self.shape[0])
-
-        self._apply_multicells(tex_array, tex_array_format)
-
-        for i, (row, row_format) in enumerate(zip(tex_array, tex_array_format)):
-            tex.append(''.join(build(item, self) for pair in zip(row, row_format) for item in pair))
+        multicells = self._multicells_by_start()
+        last_j = self.shape[1] - 1
+
+        # Each cell is formatted, built and joined to its row in a single pass
+        for i, (row, formats_spec_row, commands_row) in enumerate(zip(self.data.tolist(),
+                                                                      self.formats_spec.tolist(),
+                                                                      self.commands.tolist())):
+            row_tex = []
+            merged_until = -1 # Separators are removed inside merged columns
+            for j, (content, format_spec, command_list) in enumerate(zip(row, formats_spec_row, commands_row)):
+                content = self._apply_command_list(command_list, build(self._format_content(format_spec, content)))
+                for cell_shape, *alignment in multicells.get((i, j), ()):
+                    content = self._merge_cells(content, cell_shape, *alignment)
+                    merged_until = max(merged_until, j + cell_shape[1] - 1)
+
+                row_tex.append(build(content, self))
+                if j >= merged_until:
+                    row_tex.append(' & ' if j < last_j else r'\\')
+
+            tex.append(''.join(row_tex))
             if i in self.rules:
                 for rule in self.rules[i]:
                     tex.append(build(rule))
@@ -234,7 +250,7 @@ class Tabular(TexEnvironment):
         if self.bottom_rule:
             tex.append(r'\bottomrule')
 
-        tex += [self.tail]
+        tex.append(self.tail)
         return self._build_list(tex)
 
 
@@ -89,6 +89,15 @@ class Template:
         if lines_to_add:
             preamble.extend(['%! python2latex-preamble'] + lines_to_add)
 
+    def _iter_tex(self, lines):
+        """
+        Yields the built lines separated by newlines, so that the rendered file can be written without joining it in memory first.
+        """
+        for i, line in enumerate(lines):
+            if i:
+                yield '\n'
+            yield build(line)
+
     def render(self, compile_to_pdf=True, show_pdf=True, build_from_dir='source'):
         """
         Loads the input files, parses the tex to find the anchors, inserts the code generated by python2latex then saves it to disk.
@@ -109,9 +118,7 @@ class Template:
         preamble, doc = self._split_preamble(tex)
         self._insert_tex_at_anchors(doc)
         self._update_preamble(preamble)
-        tex = '\n'.join(build(line) for line in preamble + doc)
-
-        self.output_file.save(tex)
+        self.output_file.save(self._iter_tex(preamble + doc))
 
         if compile_to_pdf:
             self.output_file.compile_to_pdf(build_from_dir=build_from_dir)
@@ -1,4 +1,5 @@
 import os
+import hashlib
 from subprocess import DEVNULL, STDOUT, check_call
 
 
@@ -33,12 +34,127 @@ class TexFile:
         return os.path.join(self.filepath, self.filename + '.tex').replace('\\', '/')
 
     def save(self, tex):
+        """
+        Args:
+            tex (Union[str, Iterable[str]]): TeX string to save, or iterable of TeX fragments written one after the other, so that the whole TeX does not need to be held in memory.
+        """
         os.makedirs(self.filepath, exist_ok=True)
-        with open(self.path, 'w', encoding='utf8') as file:
-            file.write(tex)
+        # Writes to a temporary file first then renames it, so that pdflatex never reads a partially written file
+        tmp_path = self.path + '.tmp'
+        try:
+            if isinstance(tex, str):
+                # A whole string is encoded at once and written as bytes, skipping the incremental encoder of text files
+                with open(tmp_path, 'wb', buffering=1 << 20) as file:
+                    file.write(tex.encode('utf8'))
+            else:
+                # Newlines are not translated so that both cases write the same file on every platform
+                with open(tmp_path, 'w', buffering=1 << 20, encoding='utf8', newline='') as file:
+                    file.writelines(tex)
+            os.replace(tmp_path, self.path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _tex_path(self, build_from_dir):
+        return self.path if build_from_dir == 'cwd' else self.filename + '.tex'
 
-    def compile_to_pdf(self, build_from_dir):
+    def _call(self, program, build_from_dir, *args, env=None):
+        if build_from_dir == 'cwd':
+            call = [program, '-halt-on-error', '--output-directory', self.filepath, *args]
+            cwd = '.'
+        elif build_from_dir == 'source':
+            call = [program, '-halt-on-error', *args]
+            cwd = self.filepath
+        else:
+            raise ValueError("Invalid 'build_from_dir' option. Should be one of 'source' or 'cwd'. See documentation for details.")
+        check_call(call, stdout=DEVNULL, stderr=STDOUT, cwd=cwd, env=env)
+
+    def _format_env(self, fmt):
+        # The format is saved next to the tex file, which is not in the search path of TeX when building from 'cwd'.
+        if fmt is None:
+            return None
+        return dict(os.environ, TEXFORMATS=self.filepath + os.pathsep)
+
+    def precompile_preamble(self, preamble, build_from_dir):
         r"""
+        Dumps the preamble of the saved TeX file into a format file with the 'mylatexformat' package, so that the packages do not have to be loaded again at each compilation. The name of the format contains a hash of the preamble, hence the format is only compiled again when the preamble changes.
+
+        Args:
+            preamble (str): TeX string of the preamble (everything before \begin{document}) of the saved file.
+            build_from_dir (str, either 'source' or 'cwd'): See 'compile_to_pdf'.
+
+        Returns the name of the format to pass to 'compile_to_pdf'.
+        """
+        digest = hashlib.blake2b(preamble.encode('utf8'), digest_size=8).hexdigest()
+        fmt = f'{self.filename}-preamble-{digest}'
+        if not os.path.exists(os.path.join(self.filepath, fmt + '.fmt')):
+            self._call('pdftex', build_from_dir,
+                       '-ini', f'-jobname={fmt}', '&pdflatex', 'mylatexformat.ltx', self._tex_path(build_from_dir))
+        return fmt
+
+    def _externalized_figures(self):
+        """
+        Returns the figures listed by the TikZ 'external' library (in 'list and make' mode) during the last compilation.
+        """
+        figlist = os.path.join(self.filepath, self.filename + '.figlist')
+        # A figure list older than the TeX file was not written by the last compilation and is stale
+        if not os.path.exists(figlist) or os.path.getmtime(figlist) < os.path.getmtime(self.path):
+            return []
+
+        with open(figlist, 'r', encoding='utf8') as file:
+            # Identical pictures share the same name, and compiling a figure twice at the same time would race on its files
+            return list(dict.fromkeys(line.strip() for line in file if line.strip()))
+
+    def _outdated_figures(self, figures):
+        """
+        Returns the figures that have no pdf yet or whose content changed since their pdf was made.
+        """
+        outdated_figures = []
+        for figure in figures:
+            pdf = os.path.join(self.filepath, figure + '.pdf')
+            md5 = os.path.join(self.filepath, figure + '.md5')
+            if not os.path.exists(pdf) or (os.path.exists(md5) and os.path.getmtime(md5) > os.path.getmtime(pdf)):
+                outdated_figures.append(figure)
+        return outdated_figures
+
+    def compile_externalized_figures(self, build_from_dir, fmt=None, max_workers=None):
+        r"""
+        Compiles in parallel the figures externalized by the TikZ 'external' library in 'list and make' mode that are missing or outdated. Each figure is compiled by its own pdflatex process, so that the compilation of many plots uses all the available cores.
+
+        Args:
+            build_from_dir (str, either 'source' or 'cwd'): See 'compile_to_pdf'.
+            fmt (Union[str, None]): See 'compile_to_pdf'.
+            max_workers (Union[int, None]): Maximum number of pdflatex processes running at the same time. If None, the number of processors of the machine is used.
+
+        Returns the list of the figures compiled.
+        """
+        figures = self._externalized_figures()
+        # The figures are written next to the TeX file, but the document looks for them in the directory pdflatex is called from
+        if figures and build_from_dir == 'cwd' and os.path.abspath(self.filepath) != os.getcwd():
+            raise ValueError("Externalized figures can only be compiled from the directory of the TeX file. Use the 'source' option of 'build_from_dir' or save the TeX file in the current working directory.")
+
+        figures = self._outdated_figures(figures)
+        if not figures:
+            return figures
+
+        from concurrent.futures import ThreadPoolExecutor  # Imported here since it is slow to import and rarely needed
+        tex_path = self._tex_path(build_from_dir)
+        options = [f'-fmt={fmt}'] if fmt is not None else []
+
+        def compile_figure(figure):
+            self._call('pdflatex', build_from_dir, *options, '-interaction=batchmode', f'-jobname={figure}',
+                       f'\\def\\tikzexternalrealjob{{{self.filename}}}\\input{{{tex_path}}}',
+                       env=self._format_env(fmt))
+
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            list(executor.map(compile_figure, figures))  # Consumes the iterator to raise errors if any
+
+        return figures
+
+    def compile_to_pdf(self, build_from_dir, fmt=None):
+        r"""
+        Compiles the saved TeX file to pdf. If the document contains externalized figures (see the 'externalize' option of Plot), the outdated figures are compiled in parallel, then the document is compiled again to include them.
+
         Args:
             build_from_dir (str, either 'source' or 'cwd'):
                 Directory to build from. With the 'source' option, pdflatex will be called from the directory containing the TeX file, like this:
@@ -46,16 +162,15 @@ class TexFile:
                 With the 'cwd' option, pdflatex will be called from the current working directory, like this:
                     ~/some/path/to/cwd> pdflatex 'filepath/filename.tex'
                 This can be important if you include content in the TeX file, such as with the command \input{<path_to_some_file>}, where 'path_to_some_file' should be relative to the directory where pdflatex is called.
+            fmt (Union[str, None]):
+                Name of a precompiled format to use, as returned by 'precompile_preamble'. If None, the preamble is compiled normally.
         """
-        if build_from_dir == 'cwd':
-            call = ['pdflatex', '-halt-on-error', '--output-directory', self.filepath, self.path]
-            cwd = '.'
-        elif build_from_dir == 'source':
-            call = ['pdflatex', '-halt-on-error', self.filename + '.tex']
-            cwd = self.filepath
-        else:
-            raise ValueError("Invalid 'build_from_dir' option. Should be one of 'source' or 'cwd'. See documentation for details.")
-        check_call(call, stdout=DEVNULL, stderr=STDOUT, cwd=cwd)
+        options = [f'-fmt={fmt}'] if fmt is not None else []
+        call_args = ('pdflatex', build_from_dir, *options, self._tex_path(build_from_dir))
+
+        self._call(*call_args, env=self._format_env(fmt))
+        if self.compile_externalized_figures(build_from_dir, fmt=fmt):
+            self._call(*call_args, env=self._format_env(fmt))
 
 
 class TexObject:
@@ -95,12 +210,15 @@ class TexObject:
 
     def build_preamble(self):
         packages = self.build_packages()
-        preamble = dict((build(line, self), '')
-                        for line in self.preamble)  # Removes duplicate while keeping order
-        preamble = '\n'.join([packages] + list(preamble.keys()))
+        preamble = '\n'.join([packages] + self._build_preamble_lines())
 
         return preamble
 
+    def _build_preamble_lines(self):
+        preamble = dict((build(line, self), '')
+                        for line in self.preamble)  # Removes duplicate while keeping order
+        return list(preamble.keys())
+
     def build_packages(self):
         return '\n'.join([build(package, self) for package in self.packages.values()])
 
@@ -1,8 +1,18 @@
-from functools import wraps
+from functools import wraps, lru_cache
 
 from python2latex.tex_base import TexObject, TexCommand, build
 
 
+@lru_cache(maxsize=256)
+def _build_begin(environment):
+    return f'\\begin{{{environment}}}'
+
+
+@lru_cache(maxsize=256)
+def _build_end(environment):
+    return f'\\end{{{environment}}}'
+
+
 class begin(TexCommand):
     """
     'begin' tex command wrapper.
@@ -15,6 +25,12 @@ class begin(TexCommand):
                          options_pos=options_pos,
                          **kwoptions)
 
+    def build(self):
+        # Most environments have no parameters nor options, in which case the same string is reused
+        if len(self.parameters) == 1 and isinstance(self.parameters[0], str) and not (self.options or self.kwoptions):
+            return _build_begin(self.parameters[0])
+        return super().build()
+
 
 class end(TexCommand):
     """
@@ -23,6 +39,11 @@ class end(TexCommand):
     def __init__(self, environment):
         super().__init__('end', environment)
 
+    def build(self):
+        if len(self.parameters) == 1 and isinstance(self.parameters[0], str):
+            return _build_end(self.parameters[0])
+        return super().build()
+
 
 class Label(TexCommand):
     """
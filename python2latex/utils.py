@@ -3,7 +3,6 @@ import os
 import subprocess
 import numpy as np
 from colorspacious import cspace_converter, cspace_convert
-from matplotlib.colors import hsv_to_rgb, rgb_to_hsv
 
 
 def open_file_with_default_program(filename, filepath):
@@ -60,6 +59,7 @@ def rgb2JCh(rgb):
 
 
 def JCh2hsb(JCh, restrict_hue_domain=True):
+    from matplotlib.colors import rgb_to_hsv  # Imported here since matplotlib is slow to import and rarely needed
     J, C, h = JCh
     hue = h % 360
     hsb = rgb_to_hsv(JCh2rgb((J, C, hue)))
@@ -68,6 +68,7 @@ def JCh2hsb(JCh, restrict_hue_domain=True):
     return hsb
 
 def hsb2JCh(hsb, restrict_hue_domain=True):
+    from matplotlib.colors import hsv_to_rgb  # Imported here since matplotlib is slow to import and rarely needed
     h, s, b = hsb
     hue = h % 1
     JCh = rgb2JCh(hsv_to_rgb((hue, s, b)))
@@ -32,6 +32,17 @@ class TestDocument:
             \begin{document}
             \end{document}''')
 
+    def test_precompiled_preamble_ends_dump_before_preamble_lines(self, default_doc):
+        default_doc.add_to_preamble(r'\tikzexternalize')
+        assert default_doc.build(False, False, False, precompile_preamble=True) == cleandoc(r'''
+            \documentclass{article}
+            \usepackage[utf8]{inputenc}
+            \usepackage[top=2.5cm, bottom=2.5cm, left=2.5cm, right=2.5cm]{geometry}
+            \csname endofdump\endcsname
+            \tikzexternalize
+            \begin{document}
+            \end{document}''')
+
     def test_repr(self, default_doc):
         assert repr(default_doc) == 'Document Default'
 
@@ -1,9 +1,11 @@
 import os
 import shutil
 from inspect import cleandoc
+from datetime import datetime
 
 from python2latex.color import Color
 from python2latex.document import Document
+from python2latex import plot as plot_module
 from python2latex.plot import Plot, LinePlot, MatrixPlot, _Plot
 
 
@@ -129,6 +131,78 @@ class TestPlot:
             ''')
         os.remove('plot_test.csv')
 
+    def test_ticks_from_iterators(self):
+        plot = Plot(plot_name='plot_test')
+        plot.x_ticks = (i/2 for i in range(3))
+        plot.y_ticks = map(float, ['1', '2'])
+        assert plot.axis.kwoptions['xtick'] == '{0.000,0.500,1.000}'
+        assert plot.axis.kwoptions['ytick'] == '{1.000,2.000}'
+
+    def test_build_twice_yields_same_tex(self):
+        plot = Plot(list(range(10)), list(range(10)), plot_name='plot_test', externalize=True)
+        assert plot.build() == plot.build()
+        os.remove('plot_test.csv')
+
+    def test_externalized_plot(self):
+        plot = Plot(list(range(10)), list(range(10)), plot_name='plot_test', externalize=True)
+        tex_lines = plot.build().split('\n')
+        assert tex_lines[2].startswith(r'\tikzsetnextfilename{plot-')
+        assert tex_lines[3] == r'\tikzset{external/export next=true}'
+        assert tex_lines[4] == r'\begin{tikzpicture}'
+        preamble = plot.build_preamble().split('\n')
+        assert r'\usetikzlibrary{external}' in preamble
+        assert r'\tikzexternalize[mode=list and make, up to date check=simple, export=false]' in preamble
+        os.remove('plot_test.csv')
+
+    def test_only_externalized_plots_are_exported(self):
+        doc = Document('Doc')
+        doc += Plot(list(range(10)), list(range(10)), plot_name='plot_test', externalize=True)
+        doc += Plot(list(range(10)), list(range(10)), plot_name='plot_test_plain')
+        tex_lines = doc.build(False, False, False).split('\n')
+        pictures = [i for i, line in enumerate(tex_lines) if line == r'\begin{tikzpicture}']
+        assert len(pictures) == 2
+        assert tex_lines[pictures[0] - 1] == r'\tikzset{external/export next=true}'
+        assert tex_lines.count(r'\tikzset{external/export next=true}') == 1
+        os.remove('plot_test.csv')
+        os.remove('plot_test_plain.csv')
+
+    def test_externalized_filename_depends_on_data(self, monkeypatch):
+        # The default plot name is the time of creation of the plot, hence changes between builds
+        times = iter(datetime(2020, 1, 1, 0, 0, second) for second in range(3))
+        monkeypatch.setattr(plot_module, 'dt', type('dt', (), {'now': staticmethod(lambda: next(times))}))
+        filenames = []
+        for Y in (list(range(10)), list(range(10)), list(range(1, 11))):
+            _Plot.plot_count = 0
+            Color.color_count = 0
+            plot = Plot(list(range(10)), Y, externalize=True)
+            filenames.append(plot.build().split('\n')[2])
+            os.remove(plot.plot_filepath)
+        assert filenames[0] == filenames[1]
+        assert filenames[0] != filenames[2]
+
+    def test_externalized_filename_depends_on_colors(self):
+        filenames = []
+        for palette in ([(1, 0, 0)], [(0, 0, 1)]):
+            _Plot.plot_count = 0
+            Color.color_count = 0
+            plot = Plot(list(range(10)), list(range(10)), plot_name='plot_test', palette=palette, externalize=True)
+            filenames.append(plot.build().split('\n')[2])
+        assert filenames[0] != filenames[1]
+        os.remove('plot_test.csv')
+
+    def test_save_csv_only_rewrites_changed_data(self):
+        plot = Plot([1, 2, 3], [1, 2, 3], plot_name='plot_test')
+        plot.save_to_csv()
+        with open('plot_test.csv', newline='') as file:
+            assert file.read() == 'x0,y0\r\n1,1\r\n2,2\r\n3,3\r\n'
+        os.utime('plot_test.csv', ns=(0, 0))
+        plot.save_to_csv()
+        assert os.stat('plot_test.csv').st_mtime_ns == 0
+        plot.add_plot([1, 2], [3, 4])
+        plot.save_to_csv()
+        assert os.stat('plot_test.csv').st_mtime_ns != 0
+        os.remove('plot_test.csv')
+
     def test_save_csv_to_right_path(self):
         filepath = './some_doc_path/'
         plotpath = filepath + 'plot_path/'
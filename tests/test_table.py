@@ -67,33 +67,22 @@ class TestTabular:
         three_by_three_tabular.decimal_separator = ','
         assert three_by_three_tabular._format_number(0, 0, .1) == '0,10'
 
-    def test_apply_multicells_multicolumn(self, three_by_three_tabular):
-        three_by_three_tabular[0, 0:2].multicell('content')
-        tex_array_format = np.array([[' & ']*2 + [r'\\']]*3)
-        tex_array = np.full_like(three_by_three_tabular.data, '', dtype=object)
-
-        for i, row in enumerate(three_by_three_tabular.data):
-            for j, content in enumerate(row):
-                tex_array[i, j] = str(content)
+    def test_format_number_numpy_scalars_and_text(self, three_by_three_tabular):
+        assert three_by_three_tabular._format_number(0, 0, np.float32(.1)) == '0.10'
+        assert three_by_three_tabular._format_number(0, 0, np.int64(100)) == '100'
+        assert three_by_three_tabular._format_number(0, 0, 'Spam') == 'Spam'
 
-        three_by_three_tabular._apply_multicells(tex_array, tex_array_format)
-
-        assert isinstance(tex_array[0, 0], multicolumn)
-        assert tex_array_format[0, 0] == ''
+    def test_multicells_by_start_multicolumn(self, three_by_three_tabular):
+        three_by_three_tabular[0, 0:2].multicell('content')
+        assert three_by_three_tabular._multicells_by_start() == {(0, 0): [((1, 2), '*', 'c', None)]}
+        assert isinstance(three_by_three_tabular._merge_cells('content', (1, 2), '*', 'c', None), multicolumn)
+        assert three_by_three_tabular.build().split('\n')[2] == r'\multicolumn{2}{c}{content} & 3\\'
 
-    def test_apply_multicells_multirow(self, three_by_three_tabular):
+    def test_multicells_by_start_multirow(self, three_by_three_tabular):
         three_by_three_tabular[0:2, 0].multicell('content')
-        tex_array_format = np.array([[' & ']*2 + [r'\\']]*3)
-        tex_array = np.full_like(three_by_three_tabular.data, '', dtype=object)
-
-        for i, row in enumerate(three_by_three_tabular.data):
-            for j, content in enumerate(row):
-                tex_array[i, j] = str(content)
-
-        three_by_three_tabular._apply_multicells(tex_array, tex_array_format)
-
-        assert isinstance(tex_array[0, 0], multirow)
-        assert tex_array_format[0, 0] == ' & '
+        assert three_by_three_tabular._multicells_by_start() == {(0, 0): [((2, 1), '*', 'c', None)]}
+        assert isinstance(three_by_three_tabular._merge_cells('content', (2, 1), '*', 'c', None), multirow)
+        assert three_by_three_tabular.build().split('\n')[2] == r'\multirow{2}{*}{content} & 2 & 3\\'
 
 
 class TestSelectedArea:
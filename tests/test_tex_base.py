@@ -1,3 +1,7 @@
+import os
+
+from pytest import raises
+
 from python2latex.tex_base import *
 
 
@@ -62,6 +66,9 @@ class TestTexCommand:
                           bottom='3cm',
                           options_pos='last').build() == r'\command{param1}{param2}[spam, egg, top=2cm, bottom=3cm]'
 
+    def test_command_with_empty_option_and_kwoptions(self):
+        assert TexCommand('command', 'param', options='', spam='egg').build() == r'\command{param}[spam=egg]'
+
     def test_str(self):
         assert f"{TexCommand('test')}" == r'\test'
 
@@ -72,3 +79,85 @@ def test_bold():
 
 def test_italic():
     assert italic('test').build() == r'\textit{test}'
+
+
+class TestTexFile:
+    def test_precompile_preamble_only_when_preamble_changes(self, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(TexFile, '_call', lambda self, *args, **kwargs: calls.append(args))
+        tex_file = TexFile('doc', str(tmp_path))
+        preamble = '\\documentclass{article}\n\\usepackage{tikz}'
+
+        fmt = tex_file.precompile_preamble(preamble, 'source')
+        assert len(calls) == 1
+        (tmp_path / (fmt + '.fmt')).touch()
+
+        assert tex_file.precompile_preamble(preamble, 'source') == fmt
+        assert len(calls) == 1
+
+        assert tex_file.precompile_preamble(preamble + '\n\\usepackage{booktabs}', 'source') != fmt
+        assert len(calls) == 2
+
+    def test_compile_externalized_figures_only_outdated(self, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(TexFile, '_call', lambda self, *args, **kwargs: calls.append(args))
+        tex_file = TexFile('doc', str(tmp_path))
+        tex_file.save('')
+        (tmp_path / 'doc.figlist').write_text('up_to_date\nchanged\nmissing\nmissing\n')
+        for figure, pdf_time, md5_time in [('up_to_date', 2, 1), ('changed', 1, 2)]:
+            (tmp_path / (figure + '.pdf')).touch()
+            os.utime(tmp_path / (figure + '.pdf'), (pdf_time, pdf_time))
+            (tmp_path / (figure + '.md5')).touch()
+            os.utime(tmp_path / (figure + '.md5'), (md5_time, md5_time))
+
+        assert sorted(tex_file.compile_externalized_figures('source')) == ['changed', 'missing']
+        assert len(calls) == 2
+
+    def test_compile_externalized_figures_ignores_stale_figlist(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(TexFile, '_call', lambda self, *args, **kwargs: None)
+        tex_file = TexFile('doc', str(tmp_path))
+        (tmp_path / 'doc.figlist').write_text('missing\n')
+        os.utime(tmp_path / 'doc.figlist', (0, 0))
+        tex_file.save('')
+        assert tex_file.compile_externalized_figures('source') == []
+
+    def test_compile_externalized_figures_with_format(self, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(TexFile, '_call', lambda self, *args, **kwargs: calls.append((args, kwargs)))
+        tex_file = TexFile('doc', str(tmp_path))
+        tex_file.save('')
+        (tmp_path / 'doc.figlist').write_text('missing\n')
+        tex_file.compile_externalized_figures('source', fmt='doc-preamble')
+        (args, kwargs), = calls
+        assert '-fmt=doc-preamble' in args
+        assert kwargs['env']['TEXFORMATS'].startswith(str(tmp_path))
+
+    def test_compile_externalized_figures_from_cwd_raises(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(TexFile, '_call', lambda self, *args, **kwargs: None)
+        tex_file = TexFile('doc', str(tmp_path))
+        tex_file.save('')
+        (tmp_path / 'doc.figlist').write_text('missing\n')
+        with raises(ValueError):
+            tex_file.compile_externalized_figures('cwd')
+        monkeypatch.chdir(tmp_path)
+        assert TexFile('doc', '.').compile_externalized_figures('cwd') == ['missing']
+
+    def test_save_fragments(self, tmp_path):
+        tex_file = TexFile('doc', str(tmp_path))
+        tex_file.save(fragment for fragment in [r'\begin{document}', '\n', r'\end{document}'])
+        with open(tex_file.path, encoding='utf8') as file:
+            assert file.read() == '\\begin{document}\n\\end{document}'
+
+    def test_save_failure_keeps_previous_file(self, tmp_path):
+        tex_file = TexFile('doc', str(tmp_path))
+        tex_file.save('previous')
+
+        def failing_fragments():
+            yield 'new'
+            raise RuntimeError
+
+        with raises(RuntimeError):
+            tex_file.save(failing_fragments())
+        with open(tex_file.path, encoding='utf8') as file:
+            assert file.read() == 'previous'
+        assert os.listdir(tmp_path) == ['doc.tex']